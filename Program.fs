@@ -2,6 +2,7 @@ namespace CinemaLogic
 
 open System
 open System.IO
+open System.Text
 open System.Text.Json
 open Logic
 open Storage
@@ -15,7 +16,10 @@ module Program =
         o.WriteIndented <- false
         o
 
-    let tryParse (json:string) =
+    /// Parse a request line. The client's grid size (rows, cols) is returned alongside the request
+    /// so handlers can attach a matching layout to reserve/delete responses.
+    let tryParse (json:string) : (Request * (int option * int option)) option =
+        let withDto (d:ReqDto) req = Some (req, (d.rows, d.cols))
         try
             if String.IsNullOrWhiteSpace(json) then None
             else
@@ -30,133 +34,236 @@ module Program =
                         match a with
                         | "get_layout" ->
                             let r = defaultArg d.rows 0
-                            Some (GetLayout(r, d.cols))
+                            withDto d (GetLayout(r, d.cols))
                         | "reserve" ->
                             let s = defaultArg d.seats [||]
-                            Some (Reserve(s, d.client))
+                            withDto d (Reserve(s, d.client))
                         | "delete_reservations" ->
                             let s = defaultArg d.seats [||]
-                            Some (DeleteReservations(s))
+                            withDto d (DeleteReservations(s))
                         | "list_reservations" ->
-                            Some ListReservations
+                            withDto d ListReservations
                         | "savestate" ->
-                            Some SaveState
+                            withDto d SaveState
                         | _ -> None
         with _ ->
             None
 
+    /// Binary frame codes; a request line starting with either byte is a frame, not JSON.
+    [<Literal>]
+    let FrameReserve = 1uy
+    [<Literal>]
+    let FrameDelete = 2uy
+
+    /// Decode the body of a binary request frame sent by the UI for the hot reserve/delete paths:
+    ///   rows:u8, cols:u8, count:u16 LE, count x (row:u8, col:u8), clientLength:u16 LE (0xFFFF = none), client UTF-8
+    /// A zero rows/cols means "not given". Returns None for unknown codes or malformed bodies.
+    let decodeFrame (code:byte) (body:byte[]) : (Request * (int option * int option)) option =
+        let u16 i = int body.[i] ||| (int body.[i + 1] <<< 8)
+        try
+            let size n = if n > 0 then Some n else None
+            let dims = (size (int body.[0]), size (int body.[1]))
+            let count = u16 2
+            let seats = Array.init count (fun i -> { row = int body.[4 + 2 * i]; col = int body.[5 + 2 * i] })
+            let off = 4 + 2 * count
+            let clientLen = u16 off
+            let client =
+                if clientLen = 0xFFFF then None
+                else Some (Encoding.UTF8.GetString(body, off + 2, clientLen))
+            if off + 2 + (if clientLen = 0xFFFF then 0 else clientLen) <> body.Length then None
+            else
+                match code with
+                | FrameReserve -> Some (Reserve(seats, client), dims)
+                | FrameDelete -> Some (DeleteReservations(seats), dims)
+                | _ -> None
+        with _ ->
+            None
+
     let writeResp (resp:RespDto) =
         let json = JsonSerializer.Serialize(resp, serializerOptions)
         Console.Out.WriteLine(json)
         Console.Out.Flush()
 
-    [<EntryPoint>]
-    let main argv =
-
-        // Debug file to confirm program starts
+    /// True when the request line asks the serve loop to stop ({"action":"exit"}).
+    let isExit (json:string) =
         try
-            let dbgPath = Path.Combine(Path.GetTempPath(), "cinema_debug_started.txt")
-            File.WriteAllText(dbgPath, DateTime.UtcNow.ToString("o"))
-        with _ -> ()
+            use doc = JsonDocument.Parse(json)
+            let mutable prop = Unchecked.defaultof<JsonElement>
+            doc.RootElement.TryGetProperty("action", &prop)
+            && prop.ValueKind = JsonValueKind.String
+            && prop.GetString().Trim().ToLowerInvariant() = "exit"
+        with _ ->
+            false
 
-        let cwd = Directory.GetCurrentDirectory()
-        let storagePath = Path.Combine(cwd, "data", "seats_storage.json")
+    /// Handle one parsed request against the storage file and write exactly one response line.
+    let respond (storagePath:string) (parsed:(Request * (int option * int option)) option) : int =
         let defaultRows = 6
         let defaultCols = 10
+        match parsed with
+        | None ->
+            writeResp { status="error"; message=Some "Invalid request"; layout=None; ticketIds=None; failed=None; reservations=None }
+            1
 
-        // Read stdin or fallback to argv
-        let raw =
+        | Some (req, (rowsOpt, colsOpt)) ->
             try
-                let t = Console.In.ReadToEnd()
-                if String.IsNullOrWhiteSpace(t) then
-                    if argv.Length > 0 then argv.[0] else ""
-                else t
-            with _ ->
-                if argv.Length > 0 then argv.[0] else ""
+                let abs = storagePath
+                let dir = Path.GetDirectoryName(abs)
+                if not (Directory.Exists(dir)) then Directory.CreateDirectory(dir) |> ignore
 
-        let inp = raw.Trim()
+                let state = Storage.loadState abs
 
-        if inp = "" then
-            writeResp { status="error"; message=Some "Empty request"; layout=None; ticketIds=None; failed=None; reservations=None }
-            1
-        else
-            match tryParse inp with
-            | None ->
-                writeResp { status="error"; message=Some "Invalid request"; layout=None; ticketIds=None; failed=None; reservations=None }
-                1
+                // Reserve/delete responses carry the resulting layout so the UI needs no get_layout follow-up
+                let layoutOf (st:State) =
+                    let r = match rowsOpt with Some n when n > 0 -> n | _ -> defaultRows
+                    let c = defaultArg colsOpt defaultCols
+                    Some (Logic.buildLayout st r c)
 
-            | Some req ->
-                try
-                    let abs = storagePath
-                    let dir = Path.GetDirectoryName(abs)
-                    if not (Directory.Exists(dir)) then Directory.CreateDirectory(dir) |> ignore
-
-                    let state = Storage.loadState abs
-
-                    match req with
-                    | GetLayout (rows, colsOpt) ->
-                        let r = if rows > 0 then rows else defaultRows
-                        let c = defaultArg colsOpt defaultCols
-                        let layout = Logic.buildLayout state r c
-                        writeResp { status="ok"; message=None; layout=Some layout; ticketIds=None; failed=None; reservations=None }
-                        0
+                match req with
+                | GetLayout (rows, colsOpt) ->
+                    let r = if rows > 0 then rows else defaultRows
+                    let c = defaultArg colsOpt defaultCols
+                    let layout = Logic.buildLayout state r c
+                    writeResp { status="ok"; message=None; layout=Some layout; ticketIds=None; failed=None; reservations=None }
+                    0
+
+                | Reserve (seats, client) ->
+                    let bad =
+                        seats |> Array.filter (fun s -> s.row <= 0 || s.col <= 0)
 
-                    | Reserve (seats, client) ->
-                        let bad =
-                            seats |> Array.filter (fun s -> s.row <= 0 || s.col <= 0)
-
-                        if bad.Length > 0 then
-                            writeResp {
-                                status="error"; message=Some "Invalid seat coords";
-                                layout=None; ticketIds=None; failed=Some bad; reservations=None
-                            }
-                            1
-                        else
-                            let newState, result = Logic.reserveSeats state seats client
-                            Storage.saveState abs newState
-                            writeResp {
-                                status = (if result.success then "ok" else "fail")
-                                message = Some result.message
-                                layout=None; ticketIds=Some result.ticketIds; failed=Some result.failed; reservations=None
-                            }
-                            0
-
-                    | DeleteReservations seats ->
-                        let bad = seats |> Array.filter (fun s -> s.row <= 0 || s.col <= 0)
-                        if bad.Length > 0 then
-                            writeResp {
-                                status="error"; message=Some "Invalid seat coords";
-                                layout=None; ticketIds=None; failed=Some bad; reservations=None
-                            }
-                            1
-                        else
-                            let newState, result = Logic.deleteReservations state seats
-                            Storage.saveState abs newState
-                            writeResp {
-                                status = (if result.success then "ok" else "fail")
-                                message = Some result.message
-                                layout=None; ticketIds=None; failed=None; reservations=None
-                            }
-                            0
-
-                    | ListReservations ->
-                        let reservations = Logic.listReservations state
+                    if bad.Length > 0 then
                         writeResp {
-                            status="ok"
-                            message=Some (sprintf "Found %d reservation(s)" reservations.Length)
-                            layout=None; ticketIds=None; failed=None; reservations=Some reservations
+                            status="error"; message=Some "Invalid seat coords";
+                            layout=None; ticketIds=None; failed=Some bad; reservations=None
+                        }
+                        1
+                    else
+                        let newState, result = Logic.reserveSeats state seats client
+                        Storage.saveState abs newState
+                        writeResp {
+                            status = (if result.success then "ok" else "fail")
+                            message = Some result.message
+                            layout=layoutOf newState; ticketIds=Some result.ticketIds; failed=Some result.failed; reservations=None
                         }
                         0
 
-                    | SaveState ->
-                        Storage.saveState abs state
-                        writeResp { status="ok"; message=Some "saved"; layout=None; ticketIds=None; failed=None; reservations=None }
+                | DeleteReservations seats ->
+                    let bad = seats |> Array.filter (fun s -> s.row <= 0 || s.col <= 0)
+                    if bad.Length > 0 then
+                        writeResp {
+                            status="error"; message=Some "Invalid seat coords";
+                            layout=None; ticketIds=None; failed=Some bad; reservations=None
+                        }
+                        1
+                    else
+                        let newState, result = Logic.deleteReservations state seats
+                        Storage.saveState abs newState
+                        writeResp {
+                            status = (if result.success then "ok" else "fail")
+                            message = Some result.message
+                            layout=layoutOf newState; ticketIds=None; failed=None; reservations=None
+                        }
                         0
 
-                    | Unknown ->
-                        writeResp { status="error"; message=Some "Unknown request"; layout=None; ticketIds=None; failed=None; reservations=None }
-                        1
+                | ListReservations ->
+                    let reservations = Logic.listReservations state
+                    writeResp {
+                        status="ok"
+                        message=Some (sprintf "Found %d reservation(s)" reservations.Length)
+                        layout=None; ticketIds=None; failed=None; reservations=Some reservations
+                    }
+                    0
+
+                | SaveState ->
+                    Storage.saveState abs state
+                    writeResp { status="ok"; message=Some "saved"; layout=None; ticketIds=None; failed=None; reservations=None }
+                    0
+
+                | Unknown ->
+                    writeResp { status="error"; message=Some "Unknown request"; layout=None; ticketIds=None; failed=None; reservations=None }
+                    1
+
+            with ex ->
+                writeResp { status="error"; message=Some ex.Message; layout=None; ticketIds=None; failed=None; reservations=None }
+                2
+
+    /// Read exactly n bytes, or None if the stream ends first.
+    let readExactly (input:Stream) (n:int) : byte[] option =
+        let buf = Array.zeroCreate<byte> n
+        let mutable got = 0
+        let mutable eof = false
+        while not eof && got < n do
+            let k = input.Read(buf, got, n - got)
+            if k = 0 then eof <- true else got <- got + k
+        if eof then None else Some buf
 
-                with ex ->
-                    writeResp { status="error"; message=Some ex.Message; layout=None; ticketIds=None; failed=None; reservations=None }
-                    2
+    /// Read the rest of a UTF-8 line whose first byte has already been consumed.
+    let readLine (input:Stream) (first:int) : string =
+        use line = new MemoryStream()
+        let mutable b = first
+        while b <> -1 && b <> int '\n'B do
+            line.WriteByte(byte b)
+            b <- input.ReadByte()
+        Encoding.UTF8.GetString(line.GetBuffer(), 0, int line.Length)
+
+    /// Persistent mode: one request per stdin line or binary frame, one JSON response per stdout line,
+    /// until stdin is closed or an "exit" action arrives.
+    /// A frame is code:u8 (FrameReserve/FrameDelete), bodyLength:u16 LE, body (see decodeFrame).
+    let serve (input:Stream) (storagePath:string) : int =
+        let mutable running = true
+        while running do
+            let first = input.ReadByte()
+            if first = -1 then
+                running <- false
+            elif first = int FrameReserve || first = int FrameDelete then
+                match readExactly input 2 with
+                | None -> running <- false
+                | Some header ->
+                    match readExactly input (int header.[0] ||| (int header.[1] <<< 8)) with
+                    | None -> running <- false
+                    | Some body -> respond storagePath (decodeFrame (byte first) body) |> ignore
+            else
+                let inp = (readLine input first).Trim()
+                if inp = "" then
+                    writeResp { status="error"; message=Some "Empty request"; layout=None; ticketIds=None; failed=None; reservations=None }
+                else
+                    match tryParse inp with
+                    | None when isExit inp -> running <- false
+                    | parsed -> respond storagePath parsed |> ignore
+        0
+
+    [<EntryPoint>]
+    let main argv =
+
+        // Debug file to confirm program starts
+        try
+            let dbgPath = Path.Combine(Path.GetTempPath(), "cinema_debug_started.txt")
+            File.WriteAllText(dbgPath, DateTime.UtcNow.ToString("o"))
+        with _ -> ()
+
+        let cwd = Directory.GetCurrentDirectory()
+        let storagePath = Path.Combine(cwd, "data", "seats_storage.json")
+
+        // Requests arrive as UTF-8 (unescaped client names) or binary frames,
+        // so read raw bytes instead of depending on the console code page
+        let input = new BufferedStream(Console.OpenStandardInput())
+
+        if argv |> Array.contains "--serve" then
+            serve input storagePath
+        else
+            // Read stdin or fallback to argv
+            let raw =
+                try
+                    let t = (new StreamReader(input, UTF8Encoding(false))).ReadToEnd()
+                    if String.IsNullOrWhiteSpace(t) then
+                        if argv.Length > 0 then argv.[0] else ""
+                    else t
+                with _ ->
+                    if argv.Length > 0 then argv.[0] else ""
+
+            let inp = raw.Trim()
+
+            if inp = "" then
+                writeResp { status="error"; message=Some "Empty request"; layout=None; ticketIds=None; failed=None; reservations=None }
+                1
+            else
+                respond storagePath (tryParse inp)
@@ -259,3 +259,30 @@ module Tests =
         // List all - should have 3 reservations
         let finalList = Logic.listReservations state4
         Assert.Equal(3, finalList.Length)
+
+    [<Fact>]
+    let ``decodeFrame: Reserve frame with client and grid size`` () =
+        // rows=6, cols=10, 2 seats (1,2) (3,4), client "Ann"
+        let body = [| 6uy; 10uy; 2uy; 0uy; 1uy; 2uy; 3uy; 4uy; 3uy; 0uy; byte 'A'; byte 'n'; byte 'n' |]
+        match Program.decodeFrame Program.FrameReserve body with
+        | Some (Reserve (seats, client), (rows, cols)) ->
+            Assert.Equal<SeatDto[]>([| { row = 1; col = 2 }; { row = 3; col = 4 } |], seats)
+            Assert.Equal(Some "Ann", client)
+            Assert.Equal(Some 6, rows)
+            Assert.Equal(Some 10, cols)
+        | other -> failwithf "Unexpected decode result: %A" other
+
+    [<Fact>]
+    let ``decodeFrame: Delete frame without client or grid size`` () =
+        let body = [| 0uy; 0uy; 1uy; 0uy; 5uy; 6uy; 0xFFuy; 0xFFuy |]
+        match Program.decodeFrame Program.FrameDelete body with
+        | Some (DeleteReservations seats, (rows, cols)) ->
+            Assert.Equal<SeatDto[]>([| { row = 5; col = 6 } |], seats)
+            Assert.Equal(None, rows)
+            Assert.Equal(None, cols)
+        | other -> failwithf "Unexpected decode result: %A" other
+
+    [<Fact>]
+    let ``decodeFrame: Truncated or unknown frames are rejected`` () =
+        Assert.Equal(None, Program.decodeFrame Program.FrameReserve [| 6uy; 10uy; 2uy; 0uy; 1uy; 2uy |])
+        Assert.Equal(None, Program.decodeFrame 9uy [| 0uy; 0uy; 0uy; 0uy; 0xFFuy; 0xFFuy |])
@@ -0,0 +1,31 @@
+from ui import pack_frame
+
+
+def seats(*coords):
+    return [{"row": r, "col": c} for r, c in coords]
+
+
+def test_reserve_frame_with_client_and_grid_size():
+    # Same body as the decodeFrame reserve test in Tests.fs
+    frame = pack_frame({"action": "reserve", "rows": 6, "cols": 10, "seats": seats((1, 2), (3, 4)), "client": "Ann"})
+    assert frame == bytes([1, 13, 0, 6, 10, 2, 0, 1, 2, 3, 4, 3, 0]) + b"Ann"
+
+
+def test_delete_frame_without_client_or_grid_size():
+    frame = pack_frame({"action": "delete_reservations", "seats": seats((5, 6))})
+    assert frame == bytes([2, 8, 0, 0, 0, 1, 0, 5, 6, 0xFF, 0xFF])
+
+
+def test_other_actions_go_as_json():
+    assert pack_frame({"action": "get_layout", "rows": 6, "cols": 10}) is None
+    assert pack_frame({"action": "list_reservations"}) is None
+
+
+def test_values_outside_frame_fields_go_as_json():
+    assert pack_frame({"action": "reserve", "rows": 300, "cols": 10, "seats": seats((1, 1))}) is None
+    assert pack_frame({"action": "reserve", "seats": seats((256, 1))}) is None
+    assert pack_frame({"action": "reserve", "seats": seats((1, 1)), "client": "x" * 0xFFFF}) is None
+    assert pack_frame({"action": "reserve", "seats": seats((1, 1)), "client": "é" * 0x8000}) is None
+    assert pack_frame({"action": "delete_reservations", "seats": seats(*[(1, 1)] * 0x10000)}) is None
+    # Each field fits on its own, but together they overflow the u16 body length
+    assert pack_frame({"action": "reserve", "seats": seats(*[(1, 1)] * 0x4000), "client": "x" * 0x8000}) is None
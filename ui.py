@@ -11,114 +11,268 @@ then:
   CinemaLogic/bin/Debug/net8.0/win-x64/publish/CinemaLogic.exe
 """
 
+import os
 import sys
 import json
+import struct
+import queue
+import atexit
+import tempfile
+import threading
 import subprocess
 import tkinter as tk
-from tkinter import messagebox, simpledialog
+from concurrent.futures import ThreadPoolExecutor
+# tkinter.messagebox / simpledialog are imported inside the handlers that use them, keeping them off the startup path
 from pathlib import Path
 
+# orjson is optional; it is noticeably faster on the logic round-trip but the stdlib works too.
+# _dumps returns UTF-8 bytes ready to be written to the logic pipes.
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    # Compact and unescaped, matching orjson's output: fewer bytes on the pipe, no \uXXXX expansion
+    _dumps = lambda obj: json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    _loads = json.loads
+
+# Binary request frames for the hot reserve/delete paths on the persistent worker (see Program.serve):
+#   code:u8, bodyLength:u16 LE, body = rows:u8, cols:u8, count:u16 LE, count x (row:u8, col:u8),
+#   clientLength:u16 LE (0xFFFF = no client), client UTF-8
+_FRAME_CODES = {"reserve": 1, "delete_reservations": 2}
+_NO_CLIENT = 0xFFFF
+
+
+def pack_frame(payload: dict) -> bytes | None:
+    """
+    Encode a reserve/delete payload as a binary frame, or return None if it must go as JSON
+    (other actions, or values that don't fit the frame's field sizes).
+    """
+    code = _FRAME_CODES.get(payload.get("action"))
+    if code is None:
+        return None
+    seats = payload.get("seats") or []
+    coords = [v for s in seats for v in (s["row"], s["col"])]
+    rows = payload.get("rows") or 0
+    cols = payload.get("cols") or 0
+    if not all(0 <= v <= 255 for v in (rows, cols, *coords)):
+        return None
+    client = payload.get("client")
+    client_bytes = b"" if client is None else client.encode("utf-8")
+    # Check the u16 fields before packing; body = 4-byte header + seat pairs + 2-byte client length + client
+    if len(seats) > 0xFFFF or len(client_bytes) >= _NO_CLIENT or 6 + len(coords) + len(client_bytes) > 0xFFFF:
+        return None
+    body = (struct.pack(f"<BBH{len(coords)}B", rows, cols, len(seats), *coords)
+            + struct.pack("<H", _NO_CLIENT if client is None else len(client_bytes)) + client_bytes)
+    return struct.pack("<BH", code, len(body)) + body
+
+
 # ---------- Config ----------
-DEFAULT_FSHARP_DLL = Path(__file__).resolve().parents[1] / "CinemaLogic" / "bin" / "Debug" / "net8.0" / "win-x64" / "CinemaLogic.dll"
-DEFAULT_FSHARP_EXE = Path(__file__).resolve().parents[1] / "CinemaLogic" / "bin" / "Debug" / "net8.0" / "win-x64" / "publish" / "CinemaLogic.exe"
+_BASE = Path(__file__).resolve().parents[1]
+DEFAULT_FSHARP_DLL = _BASE / "CinemaLogic" / "bin" / "Debug" / "net8.0" / "win-x64" / "CinemaLogic.dll"
+DEFAULT_FSHARP_EXE = _BASE / "CinemaLogic" / "bin" / "Debug" / "net8.0" / "win-x64" / "publish" / "CinemaLogic.exe"
+_ALT_DLL = _BASE / "CinemaLogic" / "bin" / "Debug" / "net8.0" / "CinemaLogic.dll"  # layout without a RID folder
 
 DEFAULT_ROWS = 6
 DEFAULT_COLS = 10
 
+# Seat grid geometry (pixels); each seat is one rectangle + label on a single Canvas
+SEAT_W = 56
+SEAT_H = 28
+SEAT_GAP = 4
+SEAT_COLORS = {False: ("SystemButtonFace", "black"), True: ("red", "white")}  # reserved -> (fill, text)
+
+LOGIC_POLL_MS = 5  # how often the Tk loop checks for a finished background logic call
+LOGIC_TIMEOUT = 10  # seconds to wait for the logic program to answer one request
+
+# Extra Popen arguments for launching the logic program. On Windows: no console window for it,
+# and close_fds=False so spawning skips the handle-list setup (it only needs the std pipes anyway).
+if os.name == "nt":
+    _startupinfo = subprocess.STARTUPINFO()
+    _startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _startupinfo.wShowWindow = subprocess.SW_HIDE
+    POPEN_KWARGS = {"startupinfo": _startupinfo, "creationflags": subprocess.CREATE_NO_WINDOW, "close_fds": False}
+else:
+    POPEN_KWARGS = {}
+
 # ---------- Helper to call logic ----------
-def call_logic(path: str, payload: dict, timeout: int = 10) -> dict:
+def resolve_logic_cmd(path: str) -> list[list[str]]:
     """
-    Robust caller: try multiple invocation methods and both stdin and CLI-arg delivery.
-    For each candidate command, first try providing JSON on stdin, then try passing JSON as single CLI argument.
-    Returns parsed JSON dict or raises RuntimeError/FileNotFoundError with helpful info.
+    Build the list of commands that may launch the logic program at `path`, in preference order.
+    Resolved once at startup; no filesystem checks are involved.
     """
-    from pathlib import Path
-    p = Path(path)
+    path = str(path)
+    suffix = path.lower()[-4:]
+    if suffix == ".dll":
+        return [["dotnet", path], [r"C:\Program Files\dotnet\dotnet.exe", path]]
+    if suffix == ".exe":
+        return [[path]]
+    return [[path], ["dotnet", path]]
 
-    candidates = []
 
-    # If dll is indicated or present, try dotnet approaches
-    if str(p).lower().endswith(".dll") or (p.exists() and p.suffix.lower() == ".dll"):
-        candidates.append(["dotnet", str(p)])
-        candidates.append([r"C:\Program Files\dotnet\dotnet.exe", str(p)])
+def _try_logic(cmd: list[str], mode: str, payload_bytes: bytes, timeout: int, last_err: list[str]) -> dict | None:
+    """
+    Run `cmd` once, delivering the payload on stdin (mode "stdin") or as a single CLI argument (mode "arg").
+    Returns the parsed JSON response, or None after recording why the attempt failed in `last_err`.
+    """
+    if mode == "stdin":
+        run_cmd, stdin_kw = list(cmd), {"input": payload_bytes}
+    else:
+        run_cmd, stdin_kw = list(cmd) + [payload_bytes.decode("utf-8").rstrip()], {"stdin": subprocess.DEVNULL}
+
+    try:
+        # run() kills the child itself on timeout
+        proc = subprocess.run(run_cmd, capture_output=True, timeout=timeout, **stdin_kw, **POPEN_KWARGS)
+        stdout, stderr = proc.stdout, proc.stderr.decode("utf-8", "replace")
+    except FileNotFoundError as fe:
+        last_err.append(f"Command not found: {' '.join(run_cmd)} -> {fe}")
+        return None
+    except subprocess.TimeoutExpired:
+        last_err.append(f"Timeout when running: {' '.join(run_cmd)} ({mode})")
+        return None
+    except Exception as e:
+        last_err.append(f"Failed to start {' '.join(run_cmd)} ({mode}): {e}")
+        return None
+
+    if stderr and stderr.strip():
+        last_err.append(f"Command: {' '.join(run_cmd)} ({mode}) produced stderr: {stderr.strip()}")
+
+    if stdout and stdout.strip():
+        try:
+            return _loads(stdout)
+        except Exception as e:
+            raise RuntimeError(f"Failed to parse JSON from command {' '.join(run_cmd)} ({mode}): {e}\nRaw stdout: {stdout.decode('utf-8', 'replace')}\nStderr: {stderr}")
+    return None
 
-    # If there's an exe at the path, try it
-    if p.exists() and p.suffix.lower() == ".exe":
-        candidates.append([str(p)])
 
-    # Last-resort attempts
-    if not candidates:
-        if str(p).lower().endswith(".dll"):
-            candidates.append(["dotnet", str(p)])
-            candidates.append([r"C:\Program Files\dotnet\dotnet.exe", str(p)])
-        else:
-            candidates.append([str(p)])
-            candidates.append(["dotnet", str(p)])
+def call_logic(candidates: list[list[str]], payload: dict, timeout: int = 10, cache: dict | None = None) -> dict:
+    """
+    One-shot caller, used when the persistent logic worker cannot be started.
+    Robust caller: try multiple invocation methods and both stdin and CLI-arg delivery.
+    For each candidate command (see resolve_logic_cmd), first try providing JSON on stdin, then try passing JSON as single CLI argument.
+    If `cache` is given, the first working (cmd, mode) is stored in it and tried exclusively on later calls;
+    full discovery only runs again when that fails.
+    Returns parsed JSON dict or raises RuntimeError/FileNotFoundError with helpful info.
+    """
+    if cache is None:
+        cache = {}
 
     last_err = []
-    payload_json = json.dumps(payload)
+    # Serialize once; every attempt reuses the same bytes
+    payload_bytes = _dumps(payload) + b"\n"
+
+    # Fast path: reuse the command/mode that worked last time
+    if cache.get("cmd") and cache.get("mode") in ("stdin", "arg"):
+        resp = _try_logic(cache["cmd"], cache["mode"], payload_bytes, timeout, last_err)
+        if resp is not None:
+            return resp
+        cache.clear()
 
     # For each candidate, try two modes: stdin then cli-arg
     for cmd in candidates:
-        # --- mode 1: stdin ---
-        try:
-            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            stdout, stderr = proc.communicate(payload_json, timeout=timeout)
-        except FileNotFoundError as fe:
-            last_err.append(f"Command not found: {' '.join(cmd)} -> {fe}")
-            stdout, stderr = None, None
-        except subprocess.TimeoutExpired:
-            try:
-                proc.kill()
-            except:
-                pass
-            last_err.append(f"Timeout when running: {' '.join(cmd)} (stdin)")
-            stdout, stderr = None, None
-        except Exception as e:
-            last_err.append(f"Failed to start {' '.join(cmd)} (stdin): {e}")
-            stdout, stderr = None, None
+        for mode in ("stdin", "arg"):
+            resp = _try_logic(cmd, mode, payload_bytes, timeout, last_err)
+            if resp is not None:
+                cache["cmd"] = cmd
+                cache["mode"] = mode
+                return resp
 
-        if stderr and stderr.strip():
-            last_err.append(f"Command: {' '.join(cmd)} (stdin) produced stderr: {stderr.strip()}")
+    # nothing worked
+    msg = "No valid response from logic program. Attempts:\n" + "\n".join(last_err)
+    raise RuntimeError(msg)
 
-        if stdout and stdout.strip():
-            try:
-                return json.loads(stdout.strip())
-            except Exception as e:
-                raise RuntimeError(f"Failed to parse JSON from command {' '.join(cmd)} (stdin): {e}\nRaw stdout: {stdout}\nStderr: {stderr}")
 
-        # --- mode 2: CLI-arg (pass JSON as single arg) ---
+class LogicWorker:
+    """
+    The logic program running in --serve mode: one request (JSON line or binary frame) and one
+    JSON-line response per call. Responses are read on a pump thread so every request gets a deadline,
+    and stderr goes to a temp file so a chatty worker can't block on a full pipe.
+    """
+
+    def __init__(self, cmd: list[str]):
+        self.cmd = list(cmd)
+        self._stderr = tempfile.TemporaryFile()
         try:
-            cmd_with_arg = list(cmd) + [payload_json]
-            proc = subprocess.Popen(cmd_with_arg, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            stdout, stderr = proc.communicate(timeout=timeout)
-        except FileNotFoundError as fe:
-            last_err.append(f"Command not found: {' '.join(cmd_with_arg)} -> {fe}")
-            stdout, stderr = None, None
-        except subprocess.TimeoutExpired:
+            self.proc = subprocess.Popen(self.cmd + ["--serve"], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                         stderr=self._stderr, **POPEN_KWARGS)
+        except OSError:
+            self._stderr.close()
+            raise
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, daemon=True).start()
+
+    def _pump(self):
+        for line in iter(self.proc.stdout.readline, b""):
+            self._lines.put(line)
+        self._lines.put(b"")  # EOF
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def request(self, data: bytes, timeout: int = LOGIC_TIMEOUT) -> dict:
+        """
+        Write one encoded request and return the parsed response.
+        On a timeout, exit or unparseable response the worker is killed and RuntimeError is raised.
+        """
+        try:
+            self.proc.stdin.write(data)
+            self.proc.stdin.flush()
+            line = self._lines.get(timeout=timeout)
+        except queue.Empty:
+            self.kill()
+            raise RuntimeError(f"Logic worker did not answer within {timeout}s: {' '.join(self.cmd)}")
+        except OSError:
+            line = b""
+
+        if not line.strip():
+            self.kill()
+            raise RuntimeError(f"Logic worker exited unexpectedly (code {self.proc.returncode}).\nStderr: {self.stderr_text()}")
+        try:
+            resp = _loads(line)
+        except Exception as e:
+            self.kill()
+            raise RuntimeError(f"Failed to parse JSON from logic worker: {e}\nRaw stdout: {line.decode('utf-8', 'replace')}")
+        if not isinstance(resp, dict):
+            self.kill()
+            raise RuntimeError(f"Unexpected response from logic worker: {line.decode('utf-8', 'replace')}")
+        return resp
+
+    def stderr_text(self) -> str:
+        try:
+            self._stderr.seek(0)
+            return self._stderr.read().decode("utf-8", "replace").strip()
+        except (OSError, ValueError):
+            return ""
+
+    def kill(self):
+        if self.proc.poll() is None:
+            self.proc.kill()
+        self.proc.wait()
+
+    def close(self, timeout: float = 2):
+        """Ask the worker to exit, killing it if it hasn't within `timeout` seconds."""
+        if self.alive():
             try:
-                proc.kill()
-            except:
+                self.proc.stdin.write(_dumps({"action": "exit"}) + b"\n")
+                self.proc.stdin.flush()
+                self.proc.stdin.close()
+                self.proc.wait(timeout=timeout)
+            except (OSError, subprocess.TimeoutExpired):
                 pass
-            last_err.append(f"Timeout when running: {' '.join(cmd_with_arg)} (arg)")
-            stdout, stderr = None, None
-        except Exception as e:
-            last_err.append(f"Failed to start {' '.join(cmd_with_arg)} (arg): {e}")
-            stdout, stderr = None, None
+        self.kill()
+        self._stderr.close()
 
-        if stderr and stderr.strip():
-            last_err.append(f"Command: {' '.join(cmd_with_arg)} (arg) produced stderr: {stderr.strip()}")
 
-        if stdout and stdout.strip():
-            try:
-                return json.loads(stdout.strip())
-            except Exception as e:
-                raise RuntimeError(f"Failed to parse JSON from command {' '.join(cmd_with_arg)} (arg): {e}\nRaw stdout: {stdout}\nStderr: {stderr}")
 
-    # nothing worked
-    msg = "No valid response from logic program. Attempts:\n" + "\n".join(last_err)
-    raise RuntimeError(msg)
+_EMPTY = {}  # shared read-only default, so a missing "seat" doesn't allocate a fresh dict per line
+
 
+def format_reservation(res: dict) -> str:
+    """One line of the reservations list: "Seat r-c: Ticket <id>, Client: <name>"."""
+    seat = res.get("seat") or _EMPTY
+    row = seat.get("row", "?")
+    col = seat.get("col", "?")
+    return f"Seat {row}-{col}: Ticket {res.get('ticketId', 'N/A')}, Client: {res.get('client') or 'Anonymous'}"
 
 
 # ---------- UI ----------
@@ -133,34 +287,136 @@ class CinemaUI(tk.Tk):
         if logic_path:
             self.logic_path = logic_path
         else:
-            if DEFAULT_FSHARP_DLL.exists():
+            if DEFAULT_FSHARP_DLL.is_file():
                 self.logic_path = str(DEFAULT_FSHARP_DLL)
-            elif DEFAULT_FSHARP_EXE.exists():
+            elif DEFAULT_FSHARP_EXE.is_file():
                 self.logic_path = str(DEFAULT_FSHARP_EXE)
             else:
                 # fallback relative DLL (different layout)
-                alt = Path(__file__).resolve().parents[1] / "CinemaLogic" / "bin" / "Debug" / "net8.0" / "CinemaLogic.dll"
-                self.logic_path = str(alt)
+                self.logic_path = str(_ALT_DLL)
+
+        self._cmd_candidates = resolve_logic_cmd(self.logic_path)
+
+        # Persistent logic worker: started once, then one request (JSON line or binary frame) per call.
+        # _logic_cache remembers the command (and one-shot mode) that worked so discovery runs only once.
+        self._worker = None
+        self._logic_cache = {}
+        # The worker itself is started lazily by the first call_logic, on the background thread,
+        # so the window shows up without waiting for the dotnet process to spawn
+        atexit.register(self._stop_logic)
+        # Logic calls run on a single background thread so the Tk loop never blocks on them,
+        # and requests still reach the worker pipe one at a time
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
         self.rows = DEFAULT_ROWS
         self.cols = DEFAULT_COLS
-        self.buttons = {}
-        self.selected = set()
-        self.reserved_set = set()  # Track which seats are reserved
+        self.items = {}  # (row, col) -> canvas rectangle id
+        self.texts = {}  # (row, col) -> canvas text id
+        self._seat_labels: dict[tuple[int, int], str] = {}  # (row, col) -> "row-col", rebuilt with the grid
+        # Selection and reservation state are bitmaps over the grid: bit (r-1)*cols + (c-1) is seat (r, c)
+        self._sel_bits = 0
+        self._res_bits = 0  # Track which seats are reserved
 
         self.create_widgets()
 
+        self.refresh_layout(on_error=self._on_startup_error)
+
+    def _on_startup_error(self, e):
+        from tkinter import messagebox
+        messagebox.showerror("Startup error", f"Failed to load layout:\n{e}\n\nLogic path: {self.logic_path}")
+
+    def _start_logic(self) -> LogicWorker | None:
+        """
+        Launch the logic program in --serve mode, trying each candidate command in turn.
+        A candidate is only kept (and cached) once it has answered a read-only get_layout,
+        so a build that starts but can't serve falls through to the next one.
+        Returns None if none of them work, and records that in _logic_cache so later calls go
+        straight to the one-shot path until it clears the cache.
+        """
+        if self._logic_cache.get("serve") is False:
+            return None
+        cached = self._logic_cache.get("cmd")
+        candidates = [cached] if cached else []
+        candidates += [cmd for cmd in self._cmd_candidates if cmd != cached]
+        for cmd in candidates:
+            try:
+                worker = LogicWorker(cmd)
+            except OSError:
+                continue
+            try:
+                worker.request(_dumps({"action": "get_layout"}) + b"\n")
+            except RuntimeError:
+                continue
+            self._logic_cache["cmd"] = cmd
+            return worker
+        self._logic_cache.clear()
+        self._logic_cache["serve"] = False
+        return None
+
+    def _stop_logic(self):
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.close()
+
+    def call_logic(self, payload: dict) -> dict:
+        """
+        Send one request to the persistent logic worker and return its parsed JSON response.
+        Falls back to a one-shot process per call if the worker cannot be started.
+        """
+        if self._worker is None or not self._worker.alive():
+            self._worker = self._start_logic()
+        worker = self._worker
+        if worker is None:
+            return call_logic(self._cmd_candidates, payload, timeout=LOGIC_TIMEOUT, cache=self._logic_cache)
+
+        frame = pack_frame(payload)
         try:
-            self.refresh_layout()
-        except Exception as e:
-            messagebox.showerror("Startup error", f"Failed to load layout:\n{e}\n\nLogic path: {self.logic_path}")
+            return worker.request(frame if frame is not None else _dumps(payload) + b"\n")
+        except RuntimeError:
+            # The worker has been killed; the next call starts (and re-validates) a fresh one
+            self._worker = None
+            self._logic_cache.clear()
+            raise
+
+    def run_logic(self, payload: dict, callback):
+        """
+        Run call_logic(payload) on the background thread and pass the finished future to
+        callback(fut) on the Tk thread. Action buttons stay disabled while the request is in flight.
+        """
+        self.set_busy(True)
+        fut = self._executor.submit(self.call_logic, payload)
+        self.after(LOGIC_POLL_MS, self._poll_logic, fut, callback)
+
+    def _poll_logic(self, fut, callback):
+        # Polled from the Tk thread rather than using fut.add_done_callback: Tk calls made from the
+        # executor thread block until the main loop services them, which can deadlock on_close.
+        if not fut.done():
+            self.after(LOGIC_POLL_MS, self._poll_logic, fut, callback)
+            return
+        self.set_busy(False)
+        callback(fut)
+
+    def set_busy(self, busy: bool):
+        state = "disabled" if busy else "normal"
+        for btn in (self.reserve_btn, self.delete_btn, self.list_btn, self.refresh_btn):
+            btn.config(state=state)
+
+    def on_close(self):
+        # Don't wait on an in-flight request: the worker gets a short grace period to exit, then is killed,
+        # which also unblocks the background thread
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._stop_logic()
+        self.destroy()
 
     def create_widgets(self):
         top = tk.Frame(self, padx=10, pady=10)
         top.pack(fill="both", expand=True)
 
-        self.grid_frame = tk.Frame(top)
-        self.grid_frame.pack(side="top", pady=6)
+        self.canvas = tk.Canvas(top, width=self.cols * (SEAT_W + SEAT_GAP), height=self.rows * (SEAT_H + SEAT_GAP),
+                                highlightthickness=0, bd=0)
+        self.canvas.pack(side="top", pady=6)
+        self.canvas.bind("<Button-1>", self._on_canvas_click)
 
         controls = tk.Frame(top, pady=8)
         controls.pack(side="top", fill="x")
@@ -178,83 +434,184 @@ class CinemaUI(tk.Tk):
         self.status_label = tk.Label(top, text="", anchor="w")
         self.status_label.pack(fill="x", pady=(6, 0))
 
-    def make_grid(self):
-        for widget in self.grid_frame.winfo_children():
-            widget.destroy()
-        self.buttons.clear()
+    def make_grid(self, reserved_bits: int = 0):
+        """
+        Rebuild the seat grid. Seats in `reserved_bits` are drawn reserved straight away,
+        so a fresh grid needs no per-seat itemconfig pass afterwards.
+        """
+        self.canvas.delete("all")
+        self.items.clear()
+        self.texts.clear()
+        pitch_x, pitch_y = SEAT_W + SEAT_GAP, SEAT_H + SEAT_GAP
+        self.canvas.config(width=self.cols * pitch_x, height=self.rows * pitch_y)
+        self._seat_labels = {(r, c): f"{r}-{c}" for r in range(1, self.rows + 1) for c in range(1, self.cols + 1)}
+        labels = self._seat_labels
+        bits = reserved_bits
         for r in range(1, self.rows + 1):
+            y = (r - 1) * pitch_y + SEAT_GAP // 2
             for c in range(1, self.cols + 1):
-                btn = tk.Button(self.grid_frame, text=f"{r}-{c}", width=6, height=1,
-                                command=lambda rr=r, cc=c: self.toggle_select(rr, cc))
-                btn.grid(row=r, column=c, padx=2, pady=2)
-                self.buttons[(r, c)] = btn
+                x = (c - 1) * pitch_x + SEAT_GAP // 2
+                fill, text_fill = SEAT_COLORS[bool(bits & 1)]
+                bits >>= 1
+                self.items[(r, c)] = self.canvas.create_rectangle(x, y, x + SEAT_W, y + SEAT_H,
+                                                                  fill=fill, outline="black", width=1)
+                self.texts[(r, c)] = self.canvas.create_text(x + SEAT_W // 2, y + SEAT_H // 2, text=labels[r, c], fill=text_fill)
+
+    def seat_label(self, r, c) -> str:
+        # Seats reported by the logic program may lie outside the current grid
+        return self._seat_labels.get((r, c)) or f"{r}-{c}"
+
+    def paint_seat(self, key, reserved: bool):
+        # Reserved seats stay clickable so they can be selected for deletion
+        if key not in self.items:
+            return
+        fill, text_fill = SEAT_COLORS[reserved]
+        self.canvas.itemconfig(self.items[key], fill=fill)
+        self.canvas.itemconfig(self.texts[key], fill=text_fill)
+
+    def _on_canvas_click(self, event):
+        # Hit-test by integer division; clicks in the gap go to the seat up/left of it
+        r = event.y // (SEAT_H + SEAT_GAP) + 1
+        c = event.x // (SEAT_W + SEAT_GAP) + 1
+        if (r, c) in self.items:
+            self.toggle_select(r, c)
+
+    def seat_bit(self, r, c) -> int:
+        return 1 << ((r - 1) * self.cols + (c - 1))
+
+    def iter_seats(self, bits: int):
+        """Yield (row, col) for every set bit, lowest first, i.e. in sorted row-major order."""
+        cols = self.cols
+        while bits:
+            low = bits & -bits
+            bits ^= low
+            r, c = divmod(low.bit_length() - 1, cols)
+            yield r + 1, c + 1
 
     def toggle_select(self, r, c):
-        key = (r, c)
-        if key in self.selected:
-            self.selected.remove(key)
+        # Reserved seats can be selected too (for deletion); only the toggled seat is redrawn
+        bit = self.seat_bit(r, c)
+        self._sel_bits ^= bit
+        self.outline_seat((r, c), selected=bool(self._sel_bits & bit))
+
+    def outline_seat(self, key, selected: bool):
+        # Selected seats get a thick blue outline (the canvas equivalent of a sunken button)
+        if selected:
+            self.canvas.itemconfig(self.items[key], outline="blue", width=3)
         else:
-            # Allow selecting reserved seats for deletion
-            self.selected.add(key)
-        self.update_buttons()
-
-    def update_buttons(self):
-        for (r, c), btn in self.buttons.items():
-            if (r, c) in self.selected:
-                btn.config(relief="sunken")
-            else:
-                btn.config(relief="raised")
+            self.canvas.itemconfig(self.items[key], outline="black", width=1)
+
+    def deselect_all(self):
+        old_bits, self._sel_bits = self._sel_bits, 0
+        for key in self.iter_seats(old_bits):
+            self.outline_seat(key, selected=False)
 
     def clear_selection(self):
-        self.selected.clear()
-        self.update_buttons()
+        self.deselect_all()
         self.set_status("Selection cleared.")
 
+    def mark_reserved(self, bits: int):
+        """Record the seats in `bits` as reserved, repainting only those that weren't already."""
+        changed = bits & ~self._res_bits
+        self._res_bits |= bits
+        for key in self.iter_seats(changed):
+            self.paint_seat(key, reserved=True)
+
+    def mark_free(self, bits: int):
+        """Record the seats in `bits` as free, repainting only those that were reserved."""
+        changed = bits & self._res_bits
+        self._res_bits &= ~bits
+        for key in self.iter_seats(changed):
+            self.paint_seat(key, reserved=False)
+
     def set_status(self, text):
         self.status_label.config(text=text)
 
-    def refresh_layout(self):
+    def refresh_layout(self, on_error=None):
+        """
+        Fetch the layout in the background and redraw the grid when it arrives.
+        on_error(exc) is called if that fails; by default an error dialog is shown.
+        """
         payload = {"action": "get_layout", "rows": self.rows, "cols": self.cols}
-        try:
-            resp = call_logic(self.logic_path, payload)
-        except FileNotFoundError as e:
-            raise
-        except Exception as e:
-            # Bubble up to be handled in startup or button actions
-            raise
-
-        if resp.get("status") != "ok":
-            raise RuntimeError(f"Logic error: {resp.get('message')}")
+        self.run_logic(payload, lambda fut: self._on_layout_done(fut, on_error))
 
-        layout = resp.get("layout")
-        if not layout:
-            raise RuntimeError("Invalid layout response")
+    def _on_layout_done(self, fut, on_error):
+        from tkinter import messagebox
+        try:
+            resp = fut.result()
+            if resp.get("status") != "ok":
+                raise RuntimeError(f"Logic error: {resp.get('message')}")
 
-        self.rows = layout.get("rows", self.rows)
-        self.cols = layout.get("cols", self.cols)
-        self.make_grid()
-        reserved = layout.get("reserved", [])
-        self.reserved_set = set((s["row"], s["col"]) for s in reserved)  # Store for delete validation
-        for (r, c), btn in self.buttons.items():
-            if (r, c) in self.reserved_set:
-                btn.config(bg="red", fg="white", state="normal")  # Keep enabled so can be selected for deletion
+            layout = resp.get("layout")
+            if not layout:
+                raise RuntimeError("Invalid layout response")
+        except Exception as e:
+            if on_error is None:
+                messagebox.showerror("Refresh error", f"Failed to refresh layout:\n{e}")
             else:
-                btn.config(bg="SystemButtonFace", fg="black", state="normal")
+                on_error(e)
+            return
 
-        self.selected = set()
+        self.apply_layout(layout)
         self.set_status("Layout refreshed.")
 
+    def apply_layout(self, layout: dict):
+        """
+        Bring the grid in line with a layout dict from the logic program and clear the selection.
+        """
+        rows = layout.get("rows", self.rows)
+        cols = layout.get("cols", self.cols)
+        reserved = layout.get("reserved", [])
+        # Store for delete validation; seats outside the grid can't be selected, so they are dropped
+        new_bits = 0
+        for s in reserved:
+            r, c = s["row"], s["col"]
+            if 1 <= r <= rows and 1 <= c <= cols:
+                new_bits |= 1 << ((r - 1) * cols + (c - 1))
+
+        if rows == self.rows and cols == self.cols and self.items:
+            # Same grid: only repaint seats whose reservation state flipped
+            self.mark_free(self._res_bits & ~new_bits)
+            self.mark_reserved(new_bits)
+            self.deselect_all()
+        else:
+            self.rows, self.cols = rows, cols
+            self.make_grid(new_bits)  # fresh seats come out already painted and unselected
+            self._res_bits = new_bits
+            self._sel_bits = 0
+
+    def update_layout_from(self, resp: dict, on_error=None, reserved: int = 0, freed: int = 0):
+        """
+        Apply the layout piggy-backed on a reserve/delete response. Without one, apply the seats the
+        action is known to have `reserved`/`freed` locally; only when neither is available fetch the layout.
+        """
+        layout = resp.get("layout")
+        if layout:
+            self.apply_layout(layout)
+        elif reserved or freed:
+            self.mark_reserved(reserved)
+            self.mark_free(freed)
+            self.deselect_all()
+        else:
+            self.refresh_layout(on_error=on_error)
+
     def on_reserve(self):
-        if not self.selected:
+        from tkinter import messagebox, simpledialog
+        if not self._sel_bits:
             messagebox.showinfo("No selection", "Select one or more seats to reserve.")
             return
 
-        seats_dto = [{"row": r, "col": c} for (r, c) in sorted(self.selected)]
+        sel_bits = self._sel_bits  # the selection may change while the request is in flight
+        seats_dto = [{"row": r, "col": c} for (r, c) in self.iter_seats(sel_bits)]
         client = simpledialog.askstring("Client name (optional)", "Client name (optional):", parent=self)
-        payload = {"action": "reserve", "seats": seats_dto, "client": client}
+        # rows/cols let the logic program attach the resulting layout to its response
+        payload = {"action": "reserve", "seats": seats_dto, "client": client, "rows": self.rows, "cols": self.cols}
+        self.run_logic(payload, lambda fut: self._on_reserve_done(fut, sel_bits))
 
+    def _on_reserve_done(self, fut, sel_bits):
+        from tkinter import messagebox
         try:
-            resp = call_logic(self.logic_path, payload)
+            resp = fut.result()
         except FileNotFoundError as e:
             messagebox.showerror("Logic not found", str(e))
             return
@@ -267,34 +624,31 @@ class CinemaUI(tk.Tk):
             ticketIds = resp.get("ticketIds", [])
             msg = "Reservation successful.\nTickets:\n" + "\n".join(ticketIds)
             messagebox.showinfo("Reserved", msg)
-            try:
-                self.refresh_layout()
-            except Exception as e:
-                messagebox.showwarning("Warning", f"Reserved but failed to refresh layout:\n{e}")
+            self.update_layout_from(resp, reserved=sel_bits, on_error=lambda e: messagebox.showwarning(
+                "Warning", f"Reserved but failed to refresh layout:\n{e}"))
         else:
             msg = resp.get("message", "Reservation failed.")
             failed = resp.get("failed", [])
             if failed:
-                failed_text = ", ".join(f"{s['row']}-{s['col']}" for s in failed)
+                failed_text = ", ".join(self.seat_label(s['row'], s['col']) for s in failed)
                 msg += f"\nFailed seats: {failed_text}"
             messagebox.showwarning("Reservation failed", msg)
-            try:
-                self.refresh_layout()
-            except:
-                pass
+            self.update_layout_from(resp, on_error=lambda e: None)
 
     def on_delete(self):
-        if not self.selected:
+        from tkinter import messagebox
+        if not self._sel_bits:
             messagebox.showinfo("No selection", "Select one or more RESERVED seats to delete their reservations.")
             return
 
-        # Filter to only reserved seats
-        reserved_to_delete = [(r, c) for (r, c) in self.selected if (r, c) in getattr(self, 'reserved_set', set())]
-        unreserved_selected = [(r, c) for (r, c) in self.selected if (r, c) not in getattr(self, 'reserved_set', set())]
+        # Filter to only reserved seats; both lists come out in sorted order
+        del_bits = self._sel_bits & self._res_bits
+        reserved_to_delete = list(self.iter_seats(del_bits))
+        unreserved_selected = list(self.iter_seats(self._sel_bits & ~self._res_bits))
         
         if not reserved_to_delete:
             if unreserved_selected:
-                unreserved_list = ", ".join(f"{r}-{c}" for (r, c) in sorted(unreserved_selected))
+                unreserved_list = ", ".join(self._seat_labels[k] for k in unreserved_selected)
                 messagebox.showwarning(
                     "No Reserved Seats Selected",
                     f"The following seats are not reserved and cannot be deleted:\n\n{unreserved_list}\n\nPlease select RESERVED (red) seats to delete."
@@ -304,14 +658,14 @@ class CinemaUI(tk.Tk):
             return
         
         if unreserved_selected:
-            unreserved_list = ", ".join(f"{r}-{c}" for (r, c) in sorted(unreserved_selected))
+            unreserved_list = ", ".join(self._seat_labels[k] for k in unreserved_selected)
             messagebox.showwarning(
                 "Some Seats Not Reserved",
                 f"The following seats are not reserved and will be skipped:\n\n{unreserved_list}\n\nOnly reserved seats will be deleted."
             )
 
-        seats_dto = [{"row": r, "col": c} for (r, c) in sorted(reserved_to_delete)]
-        seat_list = ", ".join(f"{r}-{c}" for (r, c) in sorted(reserved_to_delete))
+        seats_dto = [{"row": r, "col": c} for (r, c) in reserved_to_delete]
+        seat_list = ", ".join(self._seat_labels[k] for k in reserved_to_delete)
         
         # Confirm deletion
         confirm = messagebox.askyesno(
@@ -323,10 +677,13 @@ class CinemaUI(tk.Tk):
         if not confirm:
             return
 
-        payload = {"action": "delete_reservations", "seats": seats_dto}
+        payload = {"action": "delete_reservations", "seats": seats_dto, "rows": self.rows, "cols": self.cols}
+        self.run_logic(payload, lambda fut: self._on_delete_done(fut, del_bits))
 
+    def _on_delete_done(self, fut, del_bits):
+        from tkinter import messagebox
         try:
-            resp = call_logic(self.logic_path, payload)
+            resp = fut.result()
         except FileNotFoundError as e:
             messagebox.showerror("Logic not found", str(e))
             return
@@ -338,23 +695,21 @@ class CinemaUI(tk.Tk):
         if status == "ok":
             msg = resp.get("message", "Reservations deleted successfully.")
             messagebox.showinfo("Deleted", msg)
-            try:
-                self.refresh_layout()
-            except Exception as e:
-                messagebox.showwarning("Warning", f"Deleted but failed to refresh layout:\n{e}")
+            self.update_layout_from(resp, freed=del_bits, on_error=lambda e: messagebox.showwarning(
+                "Warning", f"Deleted but failed to refresh layout:\n{e}"))
         else:
             msg = resp.get("message", "Deletion failed.")
             messagebox.showerror("Deletion failed", msg)
-            try:
-                self.refresh_layout()
-            except:
-                pass
+            self.update_layout_from(resp, on_error=lambda e: None)
 
     def on_list(self):
         payload = {"action": "list_reservations"}
+        self.run_logic(payload, self._on_list_done)
 
+    def _on_list_done(self, fut):
+        from tkinter import messagebox
         try:
-            resp = call_logic(self.logic_path, payload)
+            resp = fut.result()
         except FileNotFoundError as e:
             messagebox.showerror("Logic not found", str(e))
             return
@@ -368,17 +723,8 @@ class CinemaUI(tk.Tk):
             if not reservations or len(reservations) == 0:
                 messagebox.showinfo("Reservations", "No reservations found.")
             else:
-                # Create a formatted list
-                lines = ["Reservations:\n"]
-                for res in reservations:
-                    seat = res.get("seat", {})
-                    ticket_id = res.get("ticketId", "N/A")
-                    client = res.get("client") or "Anonymous"
-                    row = seat.get("row", "?")
-                    col = seat.get("col", "?")
-                    lines.append(f"Seat {row}-{col}: Ticket {ticket_id}, Client: {client}")
-                
-                msg = "\n".join(lines)
+                # Create a formatted list; one join over a generator, no per-line appends
+                msg = "Reservations:\n\n" + "\n".join(map(format_reservation, reservations))
                 # Use a scrolled text window for long lists
                 if len(reservations) > 10:
                     # Create a new window with scrollable text